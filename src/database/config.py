@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools  # memoise settings for the lifetime of the process
 import os  # standard library helpers for environment access
 from dataclasses import dataclass  # structured container for settings
 from typing import Dict, Optional  # typing support for optional headers
@@ -11,7 +12,7 @@ from dotenv import load_dotenv  # load variables from a local .env file
 load_dotenv()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeaviateSettings:
     host: str
     port: int
@@ -25,8 +26,13 @@ class WeaviateSettings:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def load_weaviate_settings() -> WeaviateSettings:
-    """Load connection details for the Weaviate instance."""
+    """Load connection details for the Weaviate instance.
+
+    The result is cached; call ``load_weaviate_settings.cache_clear()`` after
+    changing the environment to pick up new values.
+    """
     return WeaviateSettings(
         host=os.getenv("WEAVIATE_HOST", "localhost"),
         port=_get_int("WEAVIATE_PORT", 8080),
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import json  # present metadata in a readable format
+import random  # jitter between reconnect attempts
 import sys  # exit codes and stderr output
+import time  # sleep between reconnect attempts
+from types import ModuleType  # type hint for the lazily imported SDK
 from typing import Optional  # type hints for optional metadata
 
-import weaviate  # client SDK for Weaviate operations
 from database.config import load_weaviate_settings
 
+MAX_RETRIES = 5  # connection attempts before giving up
+BASE = 0.5  # seconds; first backoff ceiling, doubled per attempt
+MAX_DELAY = 60.0  # seconds; upper bound on any single backoff
+
+
+def _get_weaviate() -> ModuleType:
+    """Import the Weaviate SDK on demand so tests can swap it without reloads."""
+    import weaviate  # client SDK for Weaviate operations
+
+    return weaviate
+
 
 def _format_meta(meta: Optional[dict]) -> str:
     if not meta:
@@ -23,22 +36,37 @@ def _format_meta(meta: Optional[dict]) -> str:
 
 
 def main() -> int:
+    weaviate = _get_weaviate()
     settings = load_weaviate_settings()
     headers = settings.headers
 
-    try:
-        with weaviate.connect_to_local(
-            host=settings.host,
-            port=settings.port,
-            grpc_port=settings.grpc_port,
-            headers=headers,
-        ) as client:
-            is_live = client.is_live()
-            is_ready = client.is_ready()
-            meta = client.get_meta()
-    except Exception as exc:  # surface connectivity failures clearly
-        print(f"[health-check] Failed to contact Weaviate: {exc}", file=sys.stderr)
-        return 1
+    for attempt in range(MAX_RETRIES):
+        try:
+            with weaviate.connect_to_local(
+                host=settings.host,
+                port=settings.port,
+                grpc_port=settings.grpc_port,
+                headers=headers,
+            ) as client:
+                is_live = client.is_live()
+                is_ready = client.is_ready()
+                meta = client.get_meta()
+            break
+        except Exception as exc:  # surface connectivity failures clearly
+            if attempt == MAX_RETRIES - 1:
+                print(
+                    f"[health-check] Failed to contact Weaviate: {exc}",
+                    file=sys.stderr,
+                )
+                return 1
+            # Full jitter keeps many callers from reconnecting in lockstep.
+            delay = random.uniform(0, min(MAX_DELAY, BASE * 2**attempt))
+            print(
+                f"[health-check] Attempt {attempt + 1} failed ({exc}); "
+                f"retrying in {delay:.2f}s",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
 
     if not (is_live and is_ready):
         print(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 try:
     from googleapiclient.discovery import build
@@ -12,6 +12,11 @@ except ImportError:  # pragma: no cover - build is patched in tests when missing
 
 from gmail.gmail_oauth2_service import GmailOAuth2Service
 
+BATCH_LIMIT = 100  # Gmail rejects batch requests with more than 100 calls
+_WANTED_HEADERS = frozenset({"subject", "from", "to"})
+# Partial response mask covering only what _simplify_message reads.
+MESSAGE_FIELDS = "id,threadId,snippet,internalDate,payload/headers(name,value)"
+
 
 class GmailEmailReadService:
     """Fetch Gmail messages using credentials managed by GmailOAuth2Service."""
@@ -24,51 +29,122 @@ class GmailEmailReadService:
     ) -> None:
         self._oauth_service = oauth_service or GmailOAuth2Service()
         self._user_id = user_id or os.getenv("GMAIL_USER_ID", "me")
+        self._gmail_client: Optional[Any] = None
+        self._credentials: Optional[Any] = None
+
+    def _get_gmail_client(self) -> Any:
+        """Return the cached Gmail API client, rebuilding it once credentials expire."""
+        if (
+            self._gmail_client is None
+            or self._credentials is None
+            or self._credentials.expired
+        ):
+            if build is None:
+                raise RuntimeError(
+                    "googleapiclient.discovery.build is required but not installed."
+                )
+            self._credentials = self._oauth_service.get_credentials()
+            self._gmail_client = build("gmail", "v1", credentials=self._credentials)
+        return self._gmail_client
+
+    def reset(self) -> None:
+        """Drop the cached client so the next fetch picks up rotated credentials."""
+        self._gmail_client = None
+        self._credentials = None
 
     def fetch_latest_messages(
         self,
         *,
         max_results: int = 2,
         label_ids: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Return an iterator over the most recent Gmail messages.
+
+        The client is resolved and the message ids are listed before this
+        returns, so setup failures raise at the call site. Message bodies are
+        then hydrated one batch at a time as the iterator is consumed. An
+        iterator is always truthy; use ``fetch_latest_messages_list`` when an
+        emptiness check or indexing is needed.
+        """
+        gmail_client = self._get_gmail_client()
+        messages_resource = gmail_client.users().messages()
+
+        messages_payload = messages_resource.list(
+            userId=self._user_id,
+            maxResults=max_results,
+            labelIds=list(label_ids) if label_ids else ["INBOX"],
+        ).execute()
+
+        message_ids = [
+            message["id"] for message in messages_payload.get("messages", [])
+        ]
+        return self._fetch_messages(gmail_client, messages_resource, message_ids)
+
+    def fetch_latest_messages_list(
+        self,
+        *,
+        max_results: int = 2,
+        label_ids: Optional[Iterable[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Return the most recent Gmail messages, defaulting to the inbox."""
-        if build is None:
-            raise RuntimeError(
-                "googleapiclient.discovery.build is required but not installed."
-            )
-        credentials = self._oauth_service.get_credentials()
-        gmail_client = build("gmail", "v1", credentials=credentials)
-
-        list_request = (
-            gmail_client.users()
-            .messages()
-            .list(
-                userId=self._user_id,
-                maxResults=max_results,
-                labelIds=list(label_ids) if label_ids else ["INBOX"],
-            )
+        """Return the most recent Gmail messages as a list."""
+        return list(
+            self.fetch_latest_messages(max_results=max_results, label_ids=label_ids)
         )
-        messages_payload = list_request.execute()
-
-        messages = messages_payload.get("messages", [])
-        results: List[Dict[str, Any]] = []
-        for message in messages:
-            message_id = message["id"]
-            detail = (
-                gmail_client.users()
-                .messages()
-                .get(userId=self._user_id, id=message_id, format="full")
-                .execute()
-            )
-            results.append(self._simplify_message(detail))
-        return results
+
+    def _fetch_messages(
+        self, gmail_client: Any, messages_resource: Any, message_ids: List[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Hydrate message ids, batching the get calls when the client supports it."""
+        if not hasattr(gmail_client, "new_batch_http_request"):
+            for message_id in message_ids:
+                yield self._simplify_message(
+                    messages_resource.get(
+                        userId=self._user_id,
+                        id=message_id,
+                        format="full",
+                        fields=MESSAGE_FIELDS,
+                    ).execute()
+                )
+            return
+
+        simplified: Dict[str, Dict[str, Any]] = {}
+
+        def _collect(
+            request_id: str,
+            response: Dict[str, Any],
+            exception: Optional[Exception],
+        ) -> None:
+            if exception is not None:
+                raise exception
+            # Normalise as responses arrive so full payloads are not retained.
+            simplified[request_id] = self._simplify_message(response)
+
+        for start in range(0, len(message_ids), BATCH_LIMIT):
+            chunk = message_ids[start : start + BATCH_LIMIT]
+            batch = gmail_client.new_batch_http_request(callback=_collect)
+            for message_id in chunk:
+                batch.add(
+                    messages_resource.get(
+                        userId=self._user_id,
+                        id=message_id,
+                        format="full",
+                        fields=MESSAGE_FIELDS,
+                    ),
+                    request_id=message_id,
+                )
+            batch.execute()
+            for message_id in chunk:
+                yield simplified.pop(message_id)
 
     @staticmethod
     def _simplify_message(message: Dict[str, Any]) -> Dict[str, Any]:
-        headers = {
-            item["name"].lower(): item["value"]
-            for item in message.get("payload", {}).get("headers", [])
-        }
+        headers: Dict[str, str] = {}
+        for item in message.get("payload", {}).get("headers", ()):
+            name = item["name"].lower()
+            if name in _WANTED_HEADERS and name not in headers:
+                headers[name] = item["value"]
+                if len(headers) == len(_WANTED_HEADERS):
+                    break
         return {
             "id": message.get("id"),
             "threadId": message.get("threadId"),
@@ -86,7 +162,7 @@ __all__ = ["GmailEmailReadService"]
 def main() -> None:
     """CLI helper to fetch and display the latest Gmail messages."""
     service = GmailEmailReadService()
-    messages = service.fetch_latest_messages(max_results=2)
+    messages = service.fetch_latest_messages_list(max_results=2)
     if not messages:
         print("No messages found.")
         return
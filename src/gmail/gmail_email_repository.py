@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
+import threading
 from contextlib import contextmanager
-from typing import Iterable, Iterator, List, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 import weaviate
 from weaviate.classes import query
 from weaviate.classes.config import Configure, DataType, Property
-from weaviate.exceptions import ObjectAlreadyExistsError
+from weaviate.classes.data import DataObject
 from weaviate.util import generate_uuid5
 
 from database.config import WeaviateSettings, load_weaviate_settings
@@ -19,12 +22,74 @@ if TYPE_CHECKING:  # pragma: no cover - import only used for typing
     from weaviate.collections.collection import Collection
 
 COLLECTION_NAME = "GmailEmail"
+_RECORD_PROPERTIES = [
+    "message_id",
+    "subject",
+    "content",
+    "sent_at",
+    "is_read",
+    "is_vectorized",
+]
+
+_SHARED_CLIENTS: Dict[WeaviateSettings, "WeaviateClient"] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_shared_client(settings: WeaviateSettings) -> "WeaviateClient":
+    """Return the process-wide client for these settings, connecting on first use."""
+    client = _SHARED_CLIENTS.get(settings)
+    if client is not None:
+        return client
+    # Connect under the lock so concurrent first calls cannot each open a
+    # client and leak the one that loses the race.
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(settings)
+        if client is None:
+            client = weaviate.connect_to_local(
+                host=settings.host,
+                port=settings.port,
+                grpc_port=settings.grpc_port,
+                headers=settings.headers,
+            )
+            _SHARED_CLIENTS[settings] = client
+        return client
+
+
+def _close_shared_clients() -> None:
+    with _SHARED_CLIENTS_LOCK:
+        while _SHARED_CLIENTS:
+            _, client = _SHARED_CLIENTS.popitem()
+            client.close()
+
+
+atexit.register(_close_shared_clients)
+
+
+@functools.lru_cache(maxsize=8192)
+def message_uuid(message_id: str) -> str:
+    """Return the Weaviate object UUID stored for a Gmail message id.
+
+    The UUID is derived deterministically from the message id, so it doubles
+    as the ``after`` cursor for ``GmailEmailRepository.iter_unvectorized``.
+    """
+    return str(generate_uuid5(COLLECTION_NAME, message_id))
 
 
 class GmailEmailRepository:
     """High-level helper for managing Gmail email records in Weaviate."""
 
-    def __init__(self, client: "WeaviateClient", *, owns_client: bool = False):
+    def __init__(
+        self, client: Optional["WeaviateClient"] = None, *, owns_client: bool = False
+    ):
+        if client is None:
+            if owns_client:
+                raise ValueError(
+                    "owns_client=True requires an explicit client; the shared "
+                    "client is released by GmailEmailRepository.shutdown()."
+                )
+            # Share one connection per settings instead of a handshake per
+            # repository; shutdown() releases it.
+            client = _get_shared_client(load_weaviate_settings())
         self._client = client
         self._owns_client = owns_client
         self._collection = self._ensure_collection()
@@ -34,15 +99,18 @@ class GmailEmailRepository:
     def connect(
         cls, settings: Optional[WeaviateSettings] = None
     ) -> Iterator["GmailEmailRepository"]:
-        """Context-managed helper that yields a service with an active client."""
+        """Context-managed helper that yields a service bound to the shared client.
+
+        The underlying connection outlives the context and is reused by later
+        calls with the same settings; it is closed when the process exits.
+        """
         resolved = settings or load_weaviate_settings()
-        with weaviate.connect_to_local(
-            host=resolved.host,
-            port=resolved.port,
-            grpc_port=resolved.grpc_port,
-            headers=resolved.headers,
-        ) as client:
-            yield cls(client)
+        yield cls(_get_shared_client(resolved))
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close every shared client; later repositories reconnect on demand."""
+        _close_shared_clients()
 
     def __enter__(self) -> "GmailEmailRepository":
         return self
@@ -61,15 +129,25 @@ class GmailEmailRepository:
                     Property(name="content", data_type=DataType.TEXT),
                     Property(name="sent_at", data_type=DataType.DATE),
                     Property(name="is_read", data_type=DataType.BOOL),
-                    Property(name="is_vectorized", data_type=DataType.BOOL),
+                    # list_unvectorized filters on this flag; it needs the
+                    # filter index but is never keyword-searched.
+                    Property(
+                        name="is_vectorized",
+                        data_type=DataType.BOOL,
+                        index_filterable=True,
+                        index_searchable=False,
+                    ),
                 ],
                 vectorizer_config=Configure.Vectorizer.none(),
             )
         return self._client.collections.get(COLLECTION_NAME)
 
     @staticmethod
-    def _uuid_for(message_id: str) -> str:
-        return str(generate_uuid5(COLLECTION_NAME, message_id))
+    def _properties_for(record: EmailRecord, vector: Optional[List[float]]) -> dict:
+        properties = record.to_properties()
+        if vector is not None and not record.is_vectorized:
+            properties["is_vectorized"] = True
+        return properties
 
     def upsert(
         self,
@@ -77,29 +155,74 @@ class GmailEmailRepository:
         *,
         vector: Optional[List[float]] = None,
     ) -> str:
-        """Insert or update a Gmail email."""
-        properties = record.to_properties()
-        if vector is not None and not record.is_vectorized:
-            properties["is_vectorized"] = True
+        """Insert or update a Gmail email.
 
-        uuid = self._uuid_for(record.message_id)
-        try:
-            self._collection.data.insert(
-                properties=properties,
-                uuid=uuid,
-                vector=vector,
-            )
-        except ObjectAlreadyExistsError:
-            self._collection.data.update(
-                uuid=uuid,
-                properties=properties,
-                vector=vector,
+        A write that carries a vector replaces the whole stored object,
+        vector included. A write without a vector merges its properties
+        into an existing object, so a stored vector is kept.
+        """
+        uuid = message_uuid(record.message_id)
+        properties = self._properties_for(record, vector)
+        if vector is None and self._collection.data.exists(uuid):
+            self._collection.data.update(uuid=uuid, properties=properties)
+            return uuid
+        # Batch writes replace any object with the same UUID, so a single
+        # request covers both the insert and the replace case.
+        result = self._collection.data.insert_many(
+            [DataObject(properties=properties, uuid=uuid, vector=vector)]
+        )
+        # insert_many reports per-object failures instead of raising.
+        if result.has_errors:
+            error = next(iter(result.errors.values()))
+            raise RuntimeError(
+                f"Failed to upsert Gmail email {record.message_id}: {error.message}"
             )
         return uuid
 
+    def bulk_upsert(
+        self,
+        items: Iterable[Tuple[EmailRecord, Optional[List[float]]]],
+        *,
+        batch_size: Optional[int] = None,
+        concurrent_requests: int = 2,
+    ) -> List[str]:
+        """Insert or replace many emails through Weaviate's batch import.
+
+        Objects are keyed by deterministic UUIDs, so the batch replaces records
+        that already exist and re-running an ingest stays idempotent. Batches
+        are sized dynamically by the client unless ``batch_size`` is given.
+
+        Every item replaces the whole stored object. An item without a vector
+        therefore drops any stored vector, and is written with
+        ``is_vectorized=False`` so ``list_unvectorized`` queues it again.
+        """
+        if batch_size is None:
+            batch_context = self._collection.batch.dynamic()
+        else:
+            batch_context = self._collection.batch.fixed_size(
+                batch_size=batch_size, concurrent_requests=concurrent_requests
+            )
+
+        uuids: List[str] = []
+        with batch_context as batch:
+            for record, vector in items:
+                uuid = message_uuid(record.message_id)
+                properties = self._properties_for(record, vector)
+                if vector is None:
+                    properties["is_vectorized"] = False
+                batch.add_object(properties=properties, uuid=uuid, vector=vector)
+                uuids.append(uuid)
+
+        failed = self._collection.batch.failed_objects
+        if failed:
+            raise RuntimeError(
+                f"Failed to upsert {len(failed)} Gmail emails: {failed[0].message}"
+            )
+        return uuids
+
     def mark_vectorized(self, message_id: str, *, is_vectorized: bool = True) -> None:
         """Toggle the vectorised flag for an email."""
-        uuid = self._uuid_for(message_id)
+        uuid = message_uuid(message_id)
         self._collection.data.update(
             uuid=uuid,
             properties={"is_vectorized": is_vectorized},
@@ -110,18 +233,30 @@ class GmailEmailRepository:
         response = self._collection.query.fetch_objects(
             filters=query.Filter.by_property("is_vectorized").equal(False),
             limit=limit,
-            return_properties=[
-                "message_id",
-                "subject",
-                "content",
-                "sent_at",
-                "is_read",
-                "is_vectorized",
-            ],
+            return_properties=_RECORD_PROPERTIES,
         )
         for obj in response.objects:
             yield EmailRecord.from_properties(obj.properties)  # type: ignore[arg-type]
 
+    def iter_unvectorized(
+        self, *, after: Optional[str] = None
+    ) -> Iterator[EmailRecord]:
+        """Stream every email that still needs vectorisation.
+
+        Walks the collection with Weaviate's cursor iterator, so memory stays
+        bounded by one server-side page however large the backlog grows, and
+        marking records as vectorised mid-stream does not shift the cursor.
+        Pass ``after=message_uuid(record.message_id)`` for the last record
+        handled to resume a previously interrupted walk.
+        """
+        # The cursor API cannot be combined with filters, so pending records
+        # are selected client-side.
+        for obj in self._collection.iterator(
+            return_properties=_RECORD_PROPERTIES, after=after
+        ):
+            if not obj.properties.get("is_vectorized"):
+                yield EmailRecord.from_properties(obj.properties)  # type: ignore[arg-type]
+
     def close(self) -> None:
         """Close the underlying client connection if this instance owns it."""
         if self._owns_client:
@@ -129,4 +264,4 @@ class GmailEmailRepository:
             self._owns_client = False
 
 
-__all__ = ["EmailRecord", "GmailEmailRepository", "COLLECTION_NAME"]
+__all__ = ["EmailRecord", "GmailEmailRepository", "COLLECTION_NAME", "message_uuid"]
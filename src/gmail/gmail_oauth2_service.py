@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import base64
 import binascii
+import functools
 import json
 import os
+import stat
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -20,6 +22,8 @@ except ImportError:  # pragma: no cover - optional dependency at import time
     Credentials = None  # type: ignore[assignment]
     InstalledAppFlow = None  # type: ignore[assignment]
 
+dotenv.load_dotenv()
+
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
 CLIENT_SECRET_B64_ENV = "GOOGLE_CLIENT_SECRET_B64"
 TOKEN_B64_ENV = "GOOGLE_TOKEN_JSON_B64"
@@ -28,11 +32,16 @@ CLIENT_ID_ENV = "GOOGLE_CLIENT_ID"
 CLIENT_SECRET_ENV = "GOOGLE_CLIENT_SECRET"
 TOKEN_URI_ENV = "GOOGLE_TOKEN_URI"
 DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
+ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_client_config() -> Dict[str, Any]:
-    """Load the OAuth client configuration from the environment."""
-    dotenv.load_dotenv()
+    """Load the OAuth client configuration from the environment.
+
+    The decoded config is cached; call ``clear_cache()`` after changing the
+    environment.
+    """
     secret_b64 = os.getenv(CLIENT_SECRET_B64_ENV, "").strip()
     if secret_b64:
         return _decode_b64_json(secret_b64, context=CLIENT_SECRET_B64_ENV)
@@ -50,10 +59,10 @@ def _decode_b64_json(value: str, *, context: str) -> Dict[str, Any]:
         raise ValueError(f"{context} must be base64-encoded JSON") from exc
 
 
+@functools.lru_cache(maxsize=1)
 def _load_credentials() -> Optional[Credentials]:
     if Credentials is None:
         raise RuntimeError("google-auth is required to load Gmail credentials.")
-    dotenv.load_dotenv()
     token_b64 = os.getenv(TOKEN_B64_ENV, "").strip()
     if token_b64:
         data = _decode_b64_json(token_b64, context=TOKEN_B64_ENV)
@@ -83,39 +92,58 @@ def _store_credentials(creds: Credentials) -> None:
     token_json = creds.to_json()
     token_b64 = base64.b64encode(token_json.encode("utf-8")).decode("utf-8")
 
-    _update_env_variable(TOKEN_B64_ENV, token_b64)
+    updates = {TOKEN_B64_ENV: token_b64}
     if creds.refresh_token:
-        _update_env_variable(REFRESH_TOKEN_ENV, creds.refresh_token)
+        updates[REFRESH_TOKEN_ENV] = creds.refresh_token
+    _update_env_variables(updates)
+    # .env is only loaded at import, so later loads in this process read the
+    # new tokens from os.environ.
+    os.environ.update(updates)
+    clear_cache()
 
 
-def _update_env_variable(name: str, value: str) -> None:
-    env_path = Path(__file__).resolve().parents[2] / ".env"
-    lines: list[str] = []
-    found = False
+def clear_cache() -> None:
+    """Forget the cached client config and credentials so they are reloaded."""
+    _load_client_config.cache_clear()
+    _load_credentials.cache_clear()
 
-    if env_path.exists():
-        lines = env_path.read_text(encoding="utf-8").splitlines()
 
+def _update_env_variables(updates: Dict[str, str]) -> None:
+    """Write the given variables to .env in a single atomic rewrite."""
+    lines: list[str] = []
+    mode = 0o600  # a new .env holds OAuth secrets, so keep it owner-only
+    if ENV_PATH.exists():
+        lines = ENV_PATH.read_text(encoding="utf-8").splitlines()
+        mode = stat.S_IMODE(ENV_PATH.stat().st_mode)
+
+    found: set[str] = set()
     updated_lines = []
     for line in lines:
-        if line.startswith(f"{name}="):
-            updated_lines.append(f"{name}={value}")
-            found = True
+        name, sep, _ = line.partition("=")
+        if sep and name in updates:
+            updated_lines.append(f"{name}={updates[name]}")
+            found.add(name)
         else:
             updated_lines.append(line)
 
-    if not found:
-        updated_lines.append(f"{name}={value}")
+    updated_lines.extend(
+        f"{name}={value}" for name, value in updates.items() if name not in found
+    )
 
-    env_path.write_text("\n".join(updated_lines) + "\n", encoding="utf-8")
+    # Write to a sibling file first so a crash never leaves a truncated .env.
+    # The sibling is created owner-only and then given the original file's
+    # mode, so the rewrite never widens who can read the tokens.
+    tmp_path = ENV_PATH.with_name(f"{ENV_PATH.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(updated_lines) + "\n")
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, ENV_PATH)
 
 
 class GmailOAuth2Service:
     """Manage Gmail OAuth2 credentials backed by environment variables."""
 
-    def __init__(self) -> None:
-        dotenv.load_dotenv()
-
     def get_credentials(self) -> Credentials:
         """Retrieve usable Gmail credentials, refreshing or prompting if required."""
         if Credentials is None or Request is None or InstalledAppFlow is None:
@@ -144,7 +172,7 @@ def main() -> None:
     print("Gmail credentials updated in environment variables.")
 
 
-__all__ = ["GmailOAuth2Service"]
+__all__ = ["GmailOAuth2Service", "clear_cache"]
 
 
 if __name__ == "__main__":
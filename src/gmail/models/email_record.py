@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailRecord:
     """Representation of a Gmail message persisted in Weaviate."""
 
@@ -16,6 +16,19 @@ class EmailRecord:
     sent_at: datetime
     is_read: bool
     is_vectorized: bool = False
+    sent_at_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.sent_at.tzinfo is None:
+            # Naive timestamps are taken as UTC; astimezone() would otherwise
+            # read them in the host's local zone.
+            object.__setattr__(
+                self, "sent_at", self.sent_at.replace(tzinfo=timezone.utc)
+            )
+        # Weaviate DATE properties expect RFC 3339; format once per record so
+        # repeated upserts and retries reuse the same string.
+        sent_at_iso = self.sent_at.astimezone(timezone.utc).isoformat()
+        object.__setattr__(self, "sent_at_iso", sent_at_iso.replace("+00:00", "Z"))
 
     def to_properties(self) -> dict:
         """Serialise record fields for Weaviate storage."""
@@ -23,7 +36,7 @@ class EmailRecord:
             "message_id": self.message_id,
             "subject": self.subject,
             "content": self.content,
-            "sent_at": self.sent_at.isoformat(),
+            "sent_at": self.sent_at_iso,
             "is_read": self.is_read,
             "is_vectorized": self.is_vectorized,
         }
@@ -31,11 +44,16 @@ class EmailRecord:
     @classmethod
     def from_properties(cls, properties: dict) -> "EmailRecord":
         """Rehydrate a record from Weaviate query results."""
+        sent_at = properties["sent_at"]
+        if not isinstance(sent_at, datetime):
+            # The v4 client already decodes DATE properties; only raw strings
+            # (e.g. REST payloads) need parsing. Python 3.10 rejects "Z".
+            sent_at = datetime.fromisoformat(sent_at.replace("Z", "+00:00"))
         return cls(
             message_id=properties["message_id"],
             subject=properties["subject"],
             content=properties["content"],
-            sent_at=datetime.fromisoformat(properties["sent_at"]),
+            sent_at=sent_at,
             is_read=properties["is_read"],
             is_vectorized=properties["is_vectorized"],
         )
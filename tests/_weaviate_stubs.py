@@ -0,0 +1,108 @@
+"""Lightweight stand-ins for the weaviate SDK shared across the test suite."""
+
+from __future__ import annotations
+
+import sys
+import types
+from typing import Callable, Dict, List, Optional
+
+
+def install_weaviate_stubs() -> None:
+    """Ensure lightweight stand-ins for the weaviate SDK are present."""
+    if "weaviate" in sys.modules:
+        return
+
+    weaviate_module = types.ModuleType("weaviate")
+    sys.modules["weaviate"] = weaviate_module
+
+    classes_module = types.ModuleType("weaviate.classes")
+    sys.modules["weaviate.classes"] = classes_module
+
+    query_module = types.ModuleType("weaviate.classes.query")
+
+    class _PropertyFilter:
+        def __init__(self, name: str) -> None:
+            self._name = name
+
+        def equal(self, value: object) -> Callable[[Dict[str, object]], bool]:
+            name = self._name
+            return lambda properties: properties.get(name) == value
+
+    class _Filter:
+        @staticmethod
+        def by_property(name: str) -> _PropertyFilter:
+            return _PropertyFilter(name)
+
+    setattr(query_module, "Filter", _Filter)
+    sys.modules["weaviate.classes.query"] = query_module
+    setattr(classes_module, "query", query_module)
+
+    config_module = types.ModuleType("weaviate.classes.config")
+
+    class _Vectorizer:
+        @staticmethod
+        def none() -> str:
+            return "none"
+
+    class _Configure:
+        Vectorizer = _Vectorizer
+
+    class _DataType:
+        TEXT = "text"
+        DATE = "date"
+        BOOL = "bool"
+
+    class _Property:
+        def __init__(
+            self,
+            *,
+            name: str,
+            data_type: str,
+            index_filterable: Optional[bool] = None,
+            index_searchable: Optional[bool] = None,
+        ) -> None:
+            self.name = name
+            self.data_type = data_type
+            self.index_filterable = index_filterable
+            self.index_searchable = index_searchable
+
+    setattr(config_module, "Configure", _Configure)
+    setattr(config_module, "DataType", _DataType)
+    setattr(config_module, "Property", _Property)
+    sys.modules["weaviate.classes.config"] = config_module
+
+    data_module = types.ModuleType("weaviate.classes.data")
+
+    class _DataObject:
+        def __init__(
+            self,
+            *,
+            properties: Dict[str, object],
+            uuid: str,
+            vector: Optional[List[float]] = None,
+        ) -> None:
+            self.properties = properties
+            self.uuid = uuid
+            self.vector = vector
+
+    setattr(data_module, "DataObject", _DataObject)
+    sys.modules["weaviate.classes.data"] = data_module
+    setattr(classes_module, "data", data_module)
+
+    util_module = types.ModuleType("weaviate.util")
+    setattr(
+        util_module, "generate_uuid5", lambda namespace, name: f"{namespace}:{name}"
+    )
+    sys.modules["weaviate.util"] = util_module
+
+    setattr(weaviate_module, "classes", classes_module)
+    setattr(weaviate_module, "util", util_module)
+
+    class _ContextlessClient:
+        def __enter__(self) -> "_ContextlessClient":
+            return self
+
+        def __exit__(self, exc_type, exc, tb) -> None:
+            return None
+
+    setattr(weaviate_module, "connect_to_local", lambda **_: _ContextlessClient())
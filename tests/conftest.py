@@ -0,0 +1,13 @@
+"""Shared pytest configuration for the test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from _weaviate_stubs import install_weaviate_stubs
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Test modules import the Weaviate-backed repository at collection time,
+    # so the SDK stand-ins must be in place once, before any collection.
+    install_weaviate_stubs()
@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+import os
+from typing import Iterator, Optional
+
 import pytest
 
 from database.config import WeaviateSettings, _get_int, load_weaviate_settings
 
 
+@pytest.fixture(autouse=True)
+def _clear_settings_cache() -> Iterator[None]:
+    """Ensure each test observes its own environment rather than a cached value."""
+    load_weaviate_settings.cache_clear()
+    yield
+    load_weaviate_settings.cache_clear()
+
+
+def _with_env(monkeypatch: pytest.MonkeyPatch, **values: Optional[str]) -> None:
+    """Swap in an environment without WEAVIATE_* keys plus the given values."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("WEAVIATE_")}
+    env.update({k: v for k, v in values.items() if v is not None})
+    monkeypatch.setattr(os, "environ", env)
+
+
 class TestLoadWeaviateSettings:
     """Behavioural checks for the load_weaviate_settings helper."""
 
     def test_load_defaults_when_env_empty(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        for key in (
-            "WEAVIATE_HOST",
-            "WEAVIATE_PORT",
-            "WEAVIATE_GRPC_PORT",
-            "WEAVIATE_API_KEY",
-        ):
-            monkeypatch.delenv(key, raising=False)
+        _with_env(monkeypatch)
 
         settings = load_weaviate_settings()
 
@@ -29,10 +41,13 @@ class TestLoadWeaviateSettings:
         assert settings.api_key is None
 
     def test_load_values_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("WEAVIATE_HOST", "weaviate.internal")
-        monkeypatch.setenv("WEAVIATE_PORT", "1234")
-        monkeypatch.setenv("WEAVIATE_GRPC_PORT", "4321")
-        monkeypatch.setenv("WEAVIATE_API_KEY", "secret")
+        _with_env(
+            monkeypatch,
+            WEAVIATE_HOST="weaviate.internal",
+            WEAVIATE_PORT="1234",
+            WEAVIATE_GRPC_PORT="4321",
+            WEAVIATE_API_KEY="secret",
+        )
 
         settings = load_weaviate_settings()
 
@@ -41,6 +56,19 @@ class TestLoadWeaviateSettings:
         assert settings.grpc_port == 4321
         assert settings.api_key == "secret"
 
+    def test_settings_are_cached_until_cleared(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("WEAVIATE_HOST", "first")
+        first = load_weaviate_settings()
+        monkeypatch.setenv("WEAVIATE_HOST", "second")
+
+        assert load_weaviate_settings() is first
+
+        load_weaviate_settings.cache_clear()
+
+        assert load_weaviate_settings().host == "second"
+
 
 class TestWeaviateSettingsHeaders:
     """Focused tests for the computed headers property."""
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
-from typing import Callable, Dict, Optional, Tuple
-import importlib
-import sys
+from typing import Callable, Dict, List, Optional
 import types
 
 import pytest
 
+import database.health_check as health_check
+
 
 class _StubClient:
     """Minimal stand-in for the Weaviate client used by health_check."""
@@ -44,21 +44,12 @@ class _StubClient:
 def _patch_dependencies(
     monkeypatch: pytest.MonkeyPatch,
     *,
-    client_factory: Callable[[], _StubClient],
-) -> Tuple[types.ModuleType, Callable[[], _StubClient]]:
+    connect_to_local: Callable[..., Optional[_StubClient]],
+) -> types.ModuleType:
     """Patch external dependencies so main() can be exercised deterministically."""
 
-    stub_weaviate = types.SimpleNamespace(connect_to_local=None)
-    monkeypatch.setitem(sys.modules, "weaviate", stub_weaviate)
-    if "database.health_check" in sys.modules:
-        module = importlib.reload(sys.modules["database.health_check"])
-    else:
-        module = importlib.import_module("database.health_check")
-
-    def fake_connect_to_local(**_: object) -> _StubClient:
-        return client_factory()
-
-    monkeypatch.setattr(module.weaviate, "connect_to_local", fake_connect_to_local)
+    stub_weaviate = SimpleNamespace(connect_to_local=connect_to_local)
+    monkeypatch.setattr(health_check, "_get_weaviate", lambda: stub_weaviate)
 
     settings = SimpleNamespace(
         host="localhost",
@@ -66,8 +57,8 @@ def _patch_dependencies(
         grpc_port=50051,
         headers=None,
     )
-    monkeypatch.setattr(module, "load_weaviate_settings", lambda: settings)
-    return module, fake_connect_to_local
+    monkeypatch.setattr(health_check, "load_weaviate_settings", lambda: settings)
+    return health_check
 
 
 class TestHealthCheckMain:
@@ -76,9 +67,9 @@ class TestHealthCheckMain:
     def test_returns_zero_when_weaviate_is_healthy(
         self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        module, _ = _patch_dependencies(
+        module = _patch_dependencies(
             monkeypatch,
-            client_factory=lambda: _StubClient(
+            connect_to_local=lambda **_: _StubClient(
                 live=True,
                 ready=True,
                 meta={"version": "1.0.0"},
@@ -94,9 +85,9 @@ class TestHealthCheckMain:
     def test_returns_two_when_service_reports_unhealthy(
         self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        module, _ = _patch_dependencies(
+        module = _patch_dependencies(
             monkeypatch,
-            client_factory=lambda: _StubClient(
+            connect_to_local=lambda **_: _StubClient(
                 live=False,
                 ready=True,
             ),
@@ -110,26 +101,47 @@ class TestHealthCheckMain:
     def test_returns_one_when_connection_fails(
         self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
     ) -> None:
-        stub_weaviate = types.SimpleNamespace(connect_to_local=lambda **_: None)
-        monkeypatch.setitem(sys.modules, "weaviate", stub_weaviate)
-        if "database.health_check" in sys.modules:
-            module = importlib.reload(sys.modules["database.health_check"])
-        else:
-            module = importlib.import_module("database.health_check")
+        attempts = []
 
         def fake_connect(**_: object) -> None:
+            attempts.append(1)
             raise RuntimeError("boom")
 
-        monkeypatch.setattr(module.weaviate, "connect_to_local", fake_connect)
-        settings = SimpleNamespace(
-            host="localhost",
-            port=8080,
-            grpc_port=50051,
-            headers=None,
-        )
-        monkeypatch.setattr(module, "load_weaviate_settings", lambda: settings)
+        module = _patch_dependencies(monkeypatch, connect_to_local=fake_connect)
+        monkeypatch.setattr(module.time, "sleep", lambda _: None)
 
         assert module.main() == 1
 
+        assert len(attempts) == module.MAX_RETRIES
         captured = capsys.readouterr()
-        assert "Failed to contact Weaviate" in captured.err
+        assert "Failed to contact Weaviate: boom" in captured.err
+
+    def test_retries_with_jitter_then_succeeds(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        outcomes = [ConnectionError("refused"), RuntimeError("starting"), None]
+
+        def fake_connect(**_: object) -> _StubClient:
+            error = outcomes.pop(0)
+            if error is not None:
+                raise error
+            return _StubClient(live=True, ready=True)
+
+        module = _patch_dependencies(monkeypatch, connect_to_local=fake_connect)
+        monkeypatch.setattr(module, "BASE", 1.0)
+        monkeypatch.setattr(module, "MAX_DELAY", 1.5)
+        ceilings: List[float] = []
+        delays: List[float] = []
+
+        def fake_uniform(low: float, high: float) -> float:
+            assert low == 0
+            ceilings.append(high)
+            return high / 2
+
+        monkeypatch.setattr(module.random, "uniform", fake_uniform)
+        monkeypatch.setattr(module.time, "sleep", delays.append)
+
+        assert module.main() == 0
+
+        assert ceilings == [1.0, 1.5]
+        assert delays == [0.5, 0.75]
@@ -0,0 +1,74 @@
+"""Tests for the EmailRecord serialisation helpers."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+import pytest
+
+from gmail.models.email_record import EmailRecord
+
+
+@pytest.fixture
+def _host_in_new_york(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run the test with a non-UTC local timezone."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _properties(sent_at: object) -> dict:
+    return {
+        "message_id": "msg-1",
+        "subject": "Hello",
+        "content": "Body",
+        "sent_at": sent_at,
+        "is_read": True,
+        "is_vectorized": False,
+    }
+
+
+class TestFromProperties:
+    """Rehydration of records returned by Weaviate."""
+
+    def test_reuses_decoded_datetime(self) -> None:
+        sent_at = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)
+
+        record = EmailRecord.from_properties(_properties(sent_at))
+
+        assert record.sent_at is sent_at
+
+    def test_parses_iso_string(self) -> None:
+        record = EmailRecord.from_properties(_properties("2024-01-01T09:30:00+00:00"))
+
+        assert record.sent_at == datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)
+        assert record.is_read is True
+
+
+class TestToProperties:
+    """Serialisation of records for Weaviate storage."""
+
+    def test_sent_at_is_normalised_to_rfc3339_utc(self) -> None:
+        sent_at = datetime(2024, 1, 1, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+        record = EmailRecord.from_properties(_properties(sent_at))
+
+        assert record.sent_at_iso == "2024-01-01T09:30:00Z"
+        assert record.to_properties()["sent_at"] == "2024-01-01T09:30:00Z"
+
+    def test_round_trips_through_properties(self) -> None:
+        sent_at = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)
+        record = EmailRecord.from_properties(_properties(sent_at))
+
+        assert EmailRecord.from_properties(record.to_properties()) == record
+
+    @pytest.mark.usefixtures("_host_in_new_york")
+    def test_naive_sent_at_is_treated_as_utc(self) -> None:
+        record = EmailRecord.from_properties(_properties(datetime(2024, 1, 1)))
+
+        assert record.sent_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert record.to_properties()["sent_at"] == "2024-01-01T00:00:00Z"
+        assert EmailRecord.from_properties(record.to_properties()) == record
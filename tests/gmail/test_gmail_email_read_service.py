@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import pytest
 
 from gmail.gmail_email_read_service import GmailEmailReadService
+from gmail.gmail_oauth2_service import GmailOAuth2Service
 
 
 def test_fetch_latest_messages(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -35,7 +36,7 @@ def test_fetch_latest_messages(monkeypatch: pytest.MonkeyPatch) -> None:
             },
         },
     }
-    fake_client = _FakeGmailClient(details)
+    fake_client = _FakeBatchGmailClient(details)
 
     monkeypatch.setenv("GMAIL_USER_ID", "me")
     monkeypatch.setattr(
@@ -44,7 +45,7 @@ def test_fetch_latest_messages(monkeypatch: pytest.MonkeyPatch) -> None:
 
     service = GmailEmailReadService(oauth_service=_StubOAuth())
 
-    messages = service.fetch_latest_messages(max_results=2)
+    messages = list(service.fetch_latest_messages(max_results=2))
 
     assert [msg["id"] for msg in messages] == ["msg-1", "msg-2"]
     assert messages[0]["subject"] == "Hello"
@@ -53,6 +54,151 @@ def test_fetch_latest_messages(monkeypatch: pytest.MonkeyPatch) -> None:
     assert messages[1]["subject"] == "Hi"
     # Ensure inbox label used by default
     assert fake_client.messages.list_calls[0]["labelIds"] == ["INBOX"]
+    assert {call[3] for call in fake_client.messages.get_calls} == {
+        "id,threadId,snippet,internalDate,payload/headers(name,value)"
+    }
+    # Both gets travel in a single batch request
+    assert [batch.request_ids for batch in fake_client.batches] == [["msg-1", "msg-2"]]
+
+
+def test_fetch_latest_messages_splits_batches_at_gmail_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    details = {f"msg-{index}": {"id": f"msg-{index}"} for index in range(150)}
+    fake_client = _FakeBatchGmailClient(details)
+    monkeypatch.setattr(
+        "gmail.gmail_email_read_service.build", lambda *args, **kwargs: fake_client
+    )
+
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+    messages = service.fetch_latest_messages_list(max_results=150)
+
+    assert [msg["id"] for msg in messages] == list(details)
+    assert [len(batch.request_ids) for batch in fake_client.batches] == [100, 50]
+
+
+def test_fetch_latest_messages_streams_one_batch_at_a_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    details = {f"msg-{index}": {"id": f"msg-{index}"} for index in range(150)}
+    fake_client = _FakeBatchGmailClient(details)
+    monkeypatch.setattr(
+        "gmail.gmail_email_read_service.build", lambda *args, **kwargs: fake_client
+    )
+
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+    messages = service.fetch_latest_messages(max_results=150)
+
+    assert next(messages)["id"] == "msg-0"
+    assert len(fake_client.batches) == 1
+
+
+def test_fetch_latest_messages_raises_setup_errors_at_call_site(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("gmail.gmail_email_read_service.build", None)
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+
+    with pytest.raises(RuntimeError, match="googleapiclient"):
+        service.fetch_latest_messages(max_results=1)
+
+
+def test_fetch_latest_messages_propagates_batch_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_client = _FakeBatchGmailClient({"msg-1": {"id": "msg-1"}})
+    fake_client.failure = RuntimeError("quota exceeded")
+    monkeypatch.setattr(
+        "gmail.gmail_email_read_service.build", lambda *args, **kwargs: fake_client
+    )
+
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        list(service.fetch_latest_messages(max_results=1))
+
+
+def test_fetch_latest_messages_falls_back_without_batch_support(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_client = _FakeGmailClient({"msg-1": {"id": "msg-1"}, "msg-2": {"id": "msg-2"}})
+    monkeypatch.setattr(
+        "gmail.gmail_email_read_service.build", lambda *args, **kwargs: fake_client
+    )
+
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+    messages = service.fetch_latest_messages_list(max_results=2)
+
+    assert [msg["id"] for msg in messages] == ["msg-1", "msg-2"]
+    assert [call[1] for call in fake_client.messages.get_calls] == ["msg-1", "msg-2"]
+
+
+def test_fetch_latest_messages_reuses_built_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_client = _FakeGmailClient({"msg-1": {"id": "msg-1", "payload": {}}})
+    build_calls: List[Tuple[Any, ...]] = []
+
+    def fake_build(*args: Any, **kwargs: Any) -> _FakeGmailClient:
+        build_calls.append(args)
+        return fake_client
+
+    monkeypatch.setattr("gmail.gmail_email_read_service.build", fake_build)
+
+    service = GmailEmailReadService(oauth_service=_StubOAuth(), user_id="me")
+    service.fetch_latest_messages_list(max_results=1)
+    service.fetch_latest_messages_list(max_results=1)
+
+    assert build_calls == [("gmail", "v1")]
+    assert len(fake_client.messages.list_calls) == 2
+
+    service.reset()
+    service.fetch_latest_messages_list(max_results=1)
+
+    assert len(build_calls) == 2
+
+
+def test_fetch_latest_messages_rebuilds_client_when_credentials_expire(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_client = _FakeGmailClient({"msg-1": {"id": "msg-1", "payload": {}}})
+    built_with: List[Any] = []
+
+    def fake_build(*args: Any, credentials: Any, **kwargs: Any) -> _FakeGmailClient:
+        built_with.append(credentials)
+        return fake_client
+
+    monkeypatch.setattr("gmail.gmail_email_read_service.build", fake_build)
+    oauth = _StubOAuth()
+
+    service = GmailEmailReadService(oauth_service=oauth, user_id="me")
+    service.fetch_latest_messages_list(max_results=1)
+    oauth.issued[0].expired = True
+    service.fetch_latest_messages_list(max_results=1)
+
+    assert built_with == oauth.issued
+    assert len(built_with) == 2
+
+
+def test_simplify_message_matches_headers_case_insensitively() -> None:
+    message = {
+        "id": "msg-1",
+        "payload": {
+            "headers": [
+                {"name": "Received", "value": "by mx.example.com"},
+                {"name": "SUBJECT", "value": "Hello"},
+                {"name": "from", "value": "a@example.com"},
+                {"name": "To", "value": "b@example.com"},
+                {"name": "Subject", "value": "Duplicate"},
+            ]
+        },
+    }
+
+    simplified = GmailEmailReadService._simplify_message(message)
+
+    assert simplified["subject"] == "Hello"
+    assert simplified["from"] == "a@example.com"
+    assert simplified["to"] == "b@example.com"
 
 
 class _FakeRequest:
@@ -67,14 +213,14 @@ class _FakeMessages:
     def __init__(self, details: Dict[str, Dict[str, Any]]) -> None:
         self._details = details
         self.list_calls: List[Dict[str, Any]] = []
-        self.get_calls: List[Tuple[str, str, str]] = []
+        self.get_calls: List[Tuple[str, str, str, str]] = []
 
     def list(self, **kwargs: Any) -> _FakeRequest:
         self.list_calls.append(kwargs)
         return _FakeRequest({"messages": [{"id": key} for key in self._details]})
 
-    def get(self, *, userId: str, id: str, format: str) -> _FakeRequest:
-        self.get_calls.append((userId, id, format))
+    def get(self, *, userId: str, id: str, format: str, fields: str) -> _FakeRequest:
+        self.get_calls.append((userId, id, format, fields))
         return _FakeRequest(self._details[id])
 
 
@@ -96,6 +242,55 @@ class _FakeGmailClient:
         return _FakeUsers(self.messages)
 
 
-class _StubOAuth:
-    def get_credentials(self) -> object:
-        return object()
+class _FakeBatch:
+    def __init__(
+        self,
+        callback: Callable[[str, Any, Optional[Exception]], None],
+        failure: Optional[Exception],
+    ) -> None:
+        self._callback = callback
+        self._failure = failure
+        self._requests: List[Tuple[str, _FakeRequest]] = []
+
+    @property
+    def request_ids(self) -> List[str]:
+        return [request_id for request_id, _ in self._requests]
+
+    def add(self, request: _FakeRequest, *, request_id: str) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self._requests:
+            if self._failure is not None:
+                self._callback(request_id, None, self._failure)
+            else:
+                self._callback(request_id, request.execute(), None)
+
+
+class _FakeBatchGmailClient(_FakeGmailClient):
+    def __init__(self, details: Dict[str, Dict[str, Any]]) -> None:
+        super().__init__(details)
+        self.batches: List[_FakeBatch] = []
+        self.failure: Optional[Exception] = None
+
+    def new_batch_http_request(
+        self, *, callback: Callable[[str, Any, Optional[Exception]], None]
+    ) -> _FakeBatch:
+        batch = _FakeBatch(callback, self.failure)
+        self.batches.append(batch)
+        return batch
+
+
+class _StubCredentials:
+    def __init__(self) -> None:
+        self.expired = False
+
+
+class _StubOAuth(GmailOAuth2Service):
+    def __init__(self) -> None:
+        self.issued: List[_StubCredentials] = []
+
+    def get_credentials(self) -> _StubCredentials:
+        credentials = _StubCredentials()
+        self.issued.append(credentials)
+        return credentials
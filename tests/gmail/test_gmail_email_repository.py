@@ -2,117 +2,50 @@
 
 from __future__ import annotations
 
-import sys
+import itertools
+import threading
+import time
 import types
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, TypedDict, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypedDict,
+    cast,
+)
 
 import pytest
 
-
-def _install_weaviate_stubs() -> None:
-    """Ensure lightweight stand-ins for the weaviate SDK are present."""
-    if "weaviate" in sys.modules:
-        return
-
-    weaviate_module = types.ModuleType("weaviate")
-    sys.modules["weaviate"] = weaviate_module
-
-    classes_module = types.ModuleType("weaviate.classes")
-    sys.modules["weaviate.classes"] = classes_module
-
-    query_module = types.ModuleType("weaviate.classes.query")
-
-    class _PropertyFilter:
-        def __init__(self, name: str) -> None:
-            self._name = name
-
-        def equal(self, value: object) -> tuple[str, str, object]:
-            return ("equal", self._name, value)
-
-    class _Filter:
-        @staticmethod
-        def by_property(name: str) -> _PropertyFilter:
-            return _PropertyFilter(name)
-
-    setattr(query_module, "Filter", _Filter)
-    sys.modules["weaviate.classes.query"] = query_module
-    setattr(classes_module, "query", query_module)
-
-    config_module = types.ModuleType("weaviate.classes.config")
-
-    class _Vectorizer:
-        @staticmethod
-        def none() -> str:
-            return "none"
-
-    class _Configure:
-        Vectorizer = _Vectorizer
-
-    class _DataType:
-        TEXT = "text"
-        DATE = "date"
-        BOOL = "bool"
-
-    class _Property:
-        def __init__(self, *, name: str, data_type: str) -> None:
-            self.name = name
-            self.data_type = data_type
-
-    setattr(config_module, "Configure", _Configure)
-    setattr(config_module, "DataType", _DataType)
-    setattr(config_module, "Property", _Property)
-    sys.modules["weaviate.classes.config"] = config_module
-
-    exceptions_module = types.ModuleType("weaviate.exceptions")
-
-    class _AlreadyExistsError(RuntimeError):
-        pass
-
-    setattr(exceptions_module, "ObjectAlreadyExistsError", _AlreadyExistsError)
-    sys.modules["weaviate.exceptions"] = exceptions_module
-
-    util_module = types.ModuleType("weaviate.util")
-    setattr(
-        util_module, "generate_uuid5", lambda namespace, name: f"{namespace}:{name}"
-    )
-    sys.modules["weaviate.util"] = util_module
-
-    setattr(weaviate_module, "classes", classes_module)
-    setattr(weaviate_module, "exceptions", exceptions_module)
-    setattr(weaviate_module, "util", util_module)
-
-    class _ContextlessClient:
-        def __enter__(self) -> "_ContextlessClient":
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:
-            return None
-
-    setattr(weaviate_module, "connect_to_local", lambda **_: _ContextlessClient())
-
-
-_install_weaviate_stubs()
-
 from gmail.gmail_email_repository import (
     COLLECTION_NAME,
     GmailEmailRepository,
-)  # noqa: E402
-import gmail.gmail_email_repository as service_module  # noqa: E402
-from gmail.models.email_record import EmailRecord  # noqa: E402
+    message_uuid,
+)
+import gmail.gmail_email_repository as service_module
+from gmail.models.email_record import EmailRecord
 
 service_module = cast(Any, service_module)
 
 
-@pytest.fixture(autouse=True)
-def _deterministic_uuid(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture(autouse=True, scope="module")
+def _deterministic_uuid() -> Iterator[None]:
     """Keep UUID generation stable for deterministic assertions."""
-
-    monkeypatch.setattr(
-        service_module,
-        "generate_uuid5",
-        lambda namespace, value: f"{namespace}:{value}",
-    )
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            service_module,
+            "generate_uuid5",
+            lambda namespace, value: f"{namespace}:{value}",
+        )
+        service_module.message_uuid.cache_clear()
+        yield
+    service_module.message_uuid.cache_clear()
 
 
 def _make_record(
@@ -137,31 +70,80 @@ def _make_record(
 class _StubCollectionData:
     def __init__(self, parent: "_StubCollection") -> None:
         self._parent = parent
+        self.errors: Dict[int, object] = {}
 
-    def insert(
+    def insert_many(self, objects: List[Any]) -> types.SimpleNamespace:
+        if self.errors:
+            return types.SimpleNamespace(has_errors=True, errors=self.errors)
+        for obj in objects:
+            self._parent.store(obj.uuid, obj.properties, obj.vector)
+        return types.SimpleNamespace(has_errors=False, errors={})
+
+    def exists(self, uuid: str) -> bool:
+        return uuid in self._parent.vectors
+
+    def update(
         self,
         *,
-        properties: Dict[str, object],
         uuid: str,
+        properties: Dict[str, object],
         vector: Optional[List[float]] = None,
     ) -> None:
-        if uuid in self._parent.items:
-            raise service_module.ObjectAlreadyExistsError()
-        self._parent.items[uuid] = {"properties": dict(properties), "vector": vector}
+        if uuid not in self._parent.vectors:
+            self._parent.store(uuid, {}, None)
+        for name, value in properties.items():
+            self._parent.cols.setdefault(name, {})[uuid] = value
+        if vector is not None:
+            self._parent.vectors[uuid] = vector
 
-    def update(
+
+class _StubBatchContext:
+    """Buffers added objects and writes them to the collection on exit."""
+
+    def __init__(self, parent: "_StubCollection") -> None:
+        self._parent = parent
+        self.pending: List[tuple[str, Dict[str, object], Optional[List[float]]]] = []
+        self.enter_count = 0
+        self.exit_count = 0
+
+    def __enter__(self) -> "_StubBatchContext":
+        self.enter_count += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.exit_count += 1
+        for uuid, properties, vector in self.pending:
+            self._parent.store(uuid, properties, vector)
+        self.pending.clear()
+
+    def add_object(
         self,
         *,
-        uuid: str,
         properties: Dict[str, object],
+        uuid: str,
         vector: Optional[List[float]] = None,
-    ) -> None:
-        if uuid not in self._parent.items:
-            self._parent.items[uuid] = {"properties": {}, "vector": None}
-        entry = self._parent.items[uuid]
-        entry["properties"].update(dict(properties))
-        if vector is not None:
-            entry["vector"] = vector
+    ) -> str:
+        self.pending.append((uuid, dict(properties), vector))
+        return uuid
+
+
+class _StubBatchManager:
+    def __init__(self, parent: "_StubCollection") -> None:
+        self._parent = parent
+        self.failed_objects: List[object] = []
+        self.fixed_size_calls: List[tuple[int, int]] = []
+        self.contexts: List[_StubBatchContext] = []
+
+    def dynamic(self) -> _StubBatchContext:
+        context = _StubBatchContext(self._parent)
+        self.contexts.append(context)
+        return context
+
+    def fixed_size(
+        self, *, batch_size: int, concurrent_requests: int
+    ) -> _StubBatchContext:
+        self.fixed_size_calls.append((batch_size, concurrent_requests))
+        return self.dynamic()
 
 
 class _StubCollectionQuery:
@@ -171,44 +153,128 @@ class _StubCollectionQuery:
     def fetch_objects(
         self,
         *,
-        filters: Optional[tuple[str, str, object]] = None,
+        filters: Optional[Callable[[Any], bool]] = None,
         limit: int,
-        return_properties: Iterable[str],
+        return_properties: Optional[Iterable[str]] = None,
     ) -> types.SimpleNamespace:
-        results = []
-        for entry in self._parent.items.values():
-            if filters and filters[0] == "equal":
-                prop_name = filters[1]
-                expected = filters[2]
-                if entry["properties"].get(prop_name) != expected:
-                    continue
-            props = {
-                key: entry["properties"][key]
-                for key in return_properties
-                if key in entry["properties"]
-            }
-            results.append(types.SimpleNamespace(properties=props))
-            if len(results) >= limit:
-                break
+        parent = self._parent
+        pred = filters or (lambda _: True)
+        project = parent.projector(return_properties)
+        matches = (uuid for uuid in parent.uuids if pred(_ColumnRow(parent.cols, uuid)))
+        results = [_Row(project(uuid)) for uuid in itertools.islice(matches, limit)]
         return types.SimpleNamespace(objects=results)
 
 
-class _StoredEntry(TypedDict):
+_EMPTY_PROPERTIES: Mapping[str, object] = types.MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
+class _Row:
+    properties: Mapping[str, object]
+    uuid: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _Stored:
     properties: Dict[str, object]
     vector: Optional[List[float]]
 
 
+class _ColumnRow:
+    """Read-only view of one object across the columns, for filter predicates."""
+
+    __slots__ = ("_cols", "_uuid")
+
+    def __init__(self, cols: Dict[str, Dict[str, object]], uuid: str) -> None:
+        self._cols = cols
+        self._uuid = uuid
+
+    def get(self, name: str, default: object = None) -> object:
+        column = self._cols.get(name)
+        return default if column is None else column.get(self._uuid, default)
+
+
 class _StubCollection:
+    """Stores objects column by column: property name -> {uuid: value}."""
+
     def __init__(self) -> None:
-        self.items: Dict[str, _StoredEntry] = {}
+        self.cols: Dict[str, Dict[str, object]] = {}
+        self.uuids: List[str] = []
+        self.vectors: Dict[str, Optional[List[float]]] = {}
         self.data = _StubCollectionData(self)
         self.query = _StubCollectionQuery(self)
+        self.batch = _StubBatchManager(self)
+
+    @property
+    def items(self) -> Dict[str, _Stored]:
+        """Row-oriented snapshot of the stored objects, for assertions."""
+        return {
+            uuid: _Stored(self.row(uuid), self.vectors[uuid]) for uuid in self.uuids
+        }
+
+    def store(
+        self,
+        uuid: str,
+        properties: Dict[str, object],
+        vector: Optional[List[float]],
+    ) -> None:
+        """Replace the object stored under uuid, as Weaviate's PUT does."""
+        if uuid in self.vectors:
+            for column in self.cols.values():
+                column.pop(uuid, None)
+        else:
+            self.uuids.append(uuid)
+        for name, value in properties.items():
+            self.cols.setdefault(name, {})[uuid] = value
+        self.vectors[uuid] = vector
+
+    def row(self, uuid: str) -> Dict[str, object]:
+        return {
+            name: column[uuid] for name, column in self.cols.items() if uuid in column
+        }
+
+    def projector(
+        self, return_properties: Optional[Iterable[str]]
+    ) -> Callable[[str], Mapping[str, object]]:
+        """Resolve the requested columns once and return a per-uuid projection.
+
+        Like Weaviate, ``None`` returns every property; only an explicit empty
+        selection returns none.
+        """
+        if return_properties is None:
+            return self.row
+        want = frozenset(return_properties)
+        if not want:
+            return lambda _: _EMPTY_PROPERTIES
+        if want >= self.cols.keys():
+            return self.row
+        columns = [(key, self.cols[key]) for key in want if key in self.cols]
+        return lambda uuid: {
+            key: column[uuid] for key, column in columns if uuid in column
+        }
+
+    def iterator(
+        self,
+        *,
+        return_properties: Optional[Iterable[str]] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[_Row]:
+        project = self.projector(return_properties)
+        start = self.uuids.index(after) + 1 if after is not None else 0
+        for uuid in self.uuids[start:]:
+            yield _Row(project(uuid), uuid=uuid)
+
+
+class _CreatedConfig(TypedDict):
+    name: str
+    properties: List[Any]
+    vectorizer_config: object
 
 
 class _StubCollectionsFacade:
     def __init__(self) -> None:
         self._collections: Dict[str, _StubCollection] = {}
-        self.created_configs: List[Dict[str, object]] = []
+        self.created_configs: List[_CreatedConfig] = []
 
     def exists(self, name: str) -> bool:
         return name in self._collections
@@ -242,6 +308,9 @@ class _StubClient:
         self.close_count += 1
         return None
 
+    def close(self) -> None:
+        self.close_count += 1
+
 
 def test_initialises_collection_when_missing() -> None:
     client = _StubClient()
@@ -252,6 +321,9 @@ def test_initialises_collection_when_missing() -> None:
     created = client.collections.created_configs[0]
     assert created["name"] == COLLECTION_NAME
     assert client.collections.exists(COLLECTION_NAME)
+    flag = next(p for p in created["properties"] if p.name == "is_vectorized")
+    assert flag.index_filterable is True
+    assert flag.index_searchable is False
 
 
 def test_upsert_inserts_new_record_and_marks_vectorized_when_vector_present() -> None:
@@ -263,9 +335,9 @@ def test_upsert_inserts_new_record_and_marks_vectorized_when_vector_present() ->
 
     assert uuid == f"{COLLECTION_NAME}:abc123"
     stored = client.collections.get(COLLECTION_NAME).items[uuid]
-    assert stored["properties"]["subject"] == "Hello"
-    assert stored["properties"]["is_vectorized"] is True
-    assert stored["vector"] == [0.1, 0.2]
+    assert stored.properties["subject"] == "Hello"
+    assert stored.properties["is_vectorized"] is True
+    assert stored.vector == [0.1, 0.2]
 
 
 def test_upsert_updates_existing_record_when_already_present() -> None:
@@ -274,12 +346,88 @@ def test_upsert_updates_existing_record_when_already_present() -> None:
     original = _make_record("abc123", subject="First")
     updated = _make_record("abc123", subject="Updated", is_vectorized=True)
 
-    service.upsert(original)
+    service.upsert(original, vector=[0.1, 0.2])
     service.upsert(updated)
 
     stored = client.collections.get(COLLECTION_NAME).items[f"{COLLECTION_NAME}:abc123"]
-    assert stored["properties"]["subject"] == "Updated"
-    assert stored["properties"]["is_vectorized"] is True
+    assert stored.properties["subject"] == "Updated"
+    assert stored.properties["is_vectorized"] is True
+    assert stored.vector == [0.1, 0.2]
+
+
+def test_upsert_raises_when_insert_reports_errors() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    collection = client.collections.get(COLLECTION_NAME)
+    collection.data.errors[0] = types.SimpleNamespace(message="bad date")
+
+    with pytest.raises(RuntimeError) as excinfo:
+        service.upsert(_make_record("msg-1"))
+
+    assert "Failed to upsert Gmail email msg-1: bad date" in str(excinfo.value)
+    assert collection.items == {}
+
+
+def test_bulk_upsert_replaces_records_in_one_batch() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    service.upsert(_make_record("msg-1", subject="First"))
+
+    uuids = service.bulk_upsert(
+        [
+            (_make_record("msg-1", subject="Updated"), None),
+            (_make_record("msg-2"), [0.3]),
+        ],
+        batch_size=50,
+    )
+
+    collection = client.collections.get(COLLECTION_NAME)
+    assert uuids == [f"{COLLECTION_NAME}:msg-1", f"{COLLECTION_NAME}:msg-2"]
+    assert collection.batch.fixed_size_calls == [(50, 2)]
+    assert collection.items[uuids[0]].properties["subject"] == "Updated"
+    assert collection.items[uuids[1]].properties["is_vectorized"] is True
+    assert collection.items[uuids[1]].vector == [0.3]
+
+
+def test_bulk_upsert_requeues_records_written_without_vector() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    service.upsert(_make_record("msg-1"), vector=[0.1, 0.2])
+
+    service.bulk_upsert([(_make_record("msg-1", is_vectorized=True), None)])
+
+    stored = client.collections.get(COLLECTION_NAME).items[f"{COLLECTION_NAME}:msg-1"]
+    assert stored.vector is None
+    assert stored.properties["is_vectorized"] is False
+    assert [record.message_id for record in service.list_unvectorized()] == ["msg-1"]
+
+
+def test_bulk_upsert_defaults_to_single_dynamic_batch() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    records = [_make_record(f"msg-{index}") for index in range(5)]
+
+    uuids = service.bulk_upsert((record, None) for record in records)
+
+    collection = client.collections.get(COLLECTION_NAME)
+    assert len(uuids) == 5
+    assert sorted(collection.items) == sorted(uuids)
+    assert collection.batch.fixed_size_calls == []
+    assert [(ctx.enter_count, ctx.exit_count) for ctx in collection.batch.contexts] == [
+        (1, 1)
+    ]
+
+
+def test_bulk_upsert_raises_when_batch_reports_failures() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    collection = client.collections.get(COLLECTION_NAME)
+    collection.batch.failed_objects.append(types.SimpleNamespace(message="bad date"))
+
+    with pytest.raises(RuntimeError) as excinfo:
+        service.bulk_upsert([(_make_record("msg-1"), None)])
+
+    assert "Failed to upsert 1 Gmail emails: bad date" in str(excinfo.value)
 
 
 def test_mark_vectorized_updates_flag() -> None:
@@ -291,7 +439,7 @@ def test_mark_vectorized_updates_flag() -> None:
     service.mark_vectorized("msg-1", is_vectorized=True)
 
     stored = client.collections.get(COLLECTION_NAME).items[f"{COLLECTION_NAME}:msg-1"]
-    assert stored["properties"]["is_vectorized"] is True
+    assert stored.properties["is_vectorized"] is True
 
 
 def test_list_unvectorized_returns_only_pending_records() -> None:
@@ -308,6 +456,140 @@ def test_list_unvectorized_returns_only_pending_records() -> None:
     assert [record.message_id for record in records] == ["pending-1"]
 
 
+def test_iter_unvectorized_streams_pending_records_while_marking() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    service.bulk_upsert(
+        [
+            (_make_record("pending-1"), None),
+            (_make_record("done-1"), [0.5]),
+            (_make_record("pending-2"), None),
+        ]
+    )
+
+    streamed = []
+    for record in service.iter_unvectorized():
+        streamed.append(record.message_id)
+        service.mark_vectorized(record.message_id)
+
+    assert streamed == ["pending-1", "pending-2"]
+    assert list(service.iter_unvectorized()) == []
+
+
+def test_iter_unvectorized_resumes_after_cursor() -> None:
+    client = _StubClient()
+    service = GmailEmailRepository(client)
+    service.bulk_upsert(
+        (_make_record(message_id), None) for message_id in ("a", "b", "c")
+    )
+    interrupted = next(service.iter_unvectorized())
+
+    records = list(
+        service.iter_unvectorized(after=message_uuid(interrupted.message_id))
+    )
+
+    assert interrupted.message_id == "a"
+    assert [record.message_id for record in records] == ["b", "c"]
+
+
+def test_connect_reuses_shared_client_across_contexts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connected: List[_StubClient] = []
+
+    def fake_connect_to_local(**_: object) -> _StubClient:
+        client = _StubClient()
+        connected.append(client)
+        return client
+
+    monkeypatch.setattr(service_module, "_SHARED_CLIENTS", {})
+    monkeypatch.setattr(
+        service_module.weaviate, "connect_to_local", fake_connect_to_local
+    )
+    settings = service_module.WeaviateSettings(host="h", port=1, grpc_port=2)
+
+    with GmailEmailRepository.connect(settings) as first:
+        first.upsert(_make_record("msg-1"))
+    with GmailEmailRepository.connect(settings) as second:
+        records = list(second.list_unvectorized())
+
+    assert len(connected) == 1
+    assert connected[0].close_count == 0
+    assert [record.message_id for record in records] == ["msg-1"]
+
+
+def test_shared_client_connects_once_under_concurrent_first_use(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connected: List[_StubClient] = []
+
+    def slow_connect_to_local(**_: object) -> _StubClient:
+        time.sleep(0.01)  # widen the window between lookup and insert
+        client = _StubClient()
+        connected.append(client)
+        return client
+
+    monkeypatch.setattr(service_module, "_SHARED_CLIENTS", {})
+    monkeypatch.setattr(
+        service_module.weaviate, "connect_to_local", slow_connect_to_local
+    )
+    settings = service_module.WeaviateSettings(host="h", port=1, grpc_port=2)
+    barrier = threading.Barrier(4)
+    results: List[object] = []
+
+    def first_use() -> None:
+        barrier.wait()
+        results.append(service_module._get_shared_client(settings))
+
+    threads = [threading.Thread(target=first_use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(connected) == 1
+    assert results == connected * 4
+
+
+def test_repositories_without_client_share_default_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connected: List[_StubClient] = []
+
+    def fake_connect_to_local(**_: object) -> _StubClient:
+        client = _StubClient()
+        connected.append(client)
+        return client
+
+    monkeypatch.setattr(service_module, "_SHARED_CLIENTS", {})
+    monkeypatch.setattr(
+        service_module.weaviate, "connect_to_local", fake_connect_to_local
+    )
+    settings = service_module.WeaviateSettings(host="h", port=1, grpc_port=2)
+    monkeypatch.setattr(service_module, "load_weaviate_settings", lambda: settings)
+
+    first = GmailEmailRepository()
+    second = GmailEmailRepository()
+    first.close()
+
+    assert first._client is second._client
+    assert connected == [first._client]
+    assert connected[0].close_count == 0
+
+    GmailEmailRepository.shutdown()
+    third = GmailEmailRepository()
+
+    assert connected[0].close_count == 1
+    assert third._client is connected[1]
+
+
+def test_owning_the_shared_default_client_is_rejected() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        GmailEmailRepository(owns_client=True)
+
+    assert "owns_client=True requires an explicit client" in str(excinfo.value)
+
+
 def test_close_invokes_client_exit_when_owned() -> None:
     client = _StubClient()
     service = GmailEmailRepository(client)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+import base64
+import json
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
 
 import pytest
 
@@ -8,6 +13,13 @@ import gmail.gmail_oauth2_service as oauth_module
 from gmail.gmail_oauth2_service import GmailOAuth2Service
 
 
+@pytest.fixture(autouse=True)
+def _clear_oauth_cache() -> Iterator[None]:
+    oauth_module.clear_cache()
+    yield
+    oauth_module.clear_cache()
+
+
 def test_get_credentials_refreshes_existing_token(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -80,6 +92,90 @@ def test_get_credentials_runs_flow_when_missing(
     assert flow.port == (0,)
 
 
+def test_get_credentials_reuses_token_stored_by_flow(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _set_required_dependencies(monkeypatch)
+    _isolate_token_environment(monkeypatch, tmp_path)
+
+    class _TokenCredentials:
+        @staticmethod
+        def from_authorized_user_info(
+            info: Dict[str, Any], scopes: list[str]
+        ) -> _StubCredentials:
+            return _StubCredentials(
+                expired=False, refresh_token="refresh-token", valid=True
+            )
+
+    flows: list[_StubFlow] = []
+
+    class _CountingInstalledFlow:
+        @classmethod
+        def from_client_config(
+            cls, config: Dict[str, Any], scopes: list[str]
+        ) -> _StubFlow:
+            flows.append(
+                _StubFlow(
+                    _StubCredentials(
+                        expired=False, refresh_token="refresh-token", valid=True
+                    )
+                )
+            )
+            return flows[-1]
+
+    monkeypatch.setattr(oauth_module, "Credentials", _TokenCredentials)
+    monkeypatch.setattr(oauth_module, "InstalledAppFlow", _CountingInstalledFlow)
+    monkeypatch.setenv(
+        oauth_module.CLIENT_SECRET_B64_ENV,
+        base64.b64encode(b'{"installed": {}}').decode("utf-8"),
+    )
+
+    service = GmailOAuth2Service()
+    service.get_credentials()
+    service.get_credentials()
+
+    assert len(flows) == 1
+    assert (
+        (tmp_path / ".env")
+        .read_text(encoding="utf-8")
+        .startswith(f"{oauth_module.TOKEN_B64_ENV}=")
+    )
+
+
+def test_get_credentials_refreshes_once_across_calls(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _set_required_dependencies(monkeypatch)
+    _isolate_token_environment(monkeypatch, tmp_path)
+    monkeypatch.setenv(
+        oauth_module.TOKEN_B64_ENV,
+        base64.b64encode(b'{"token": "stale"}').decode("utf-8"),
+    )
+    loaded: list[_StubCredentials] = []
+
+    class _TokenCredentials:
+        @staticmethod
+        def from_authorized_user_info(
+            info: Dict[str, Any], scopes: list[str]
+        ) -> _StubCredentials:
+            stale = info.get("token") == "stale"
+            loaded.append(
+                _StubCredentials(
+                    expired=stale, refresh_token="refresh-token", valid=not stale
+                )
+            )
+            return loaded[-1]
+
+    monkeypatch.setattr(oauth_module, "Credentials", _TokenCredentials)
+
+    service = GmailOAuth2Service()
+    for _ in range(3):
+        service.get_credentials()
+
+    assert sum(len(creds.refresh_calls) for creds in loaded) == 1
+    assert len(loaded) == 2  # the stale token, then the stored refresh
+
+
 def test_get_credentials_raises_when_dependencies_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -92,6 +188,49 @@ def test_get_credentials_raises_when_dependencies_missing(
         service.get_credentials()
 
 
+def test_load_client_config_decodes_once_until_cleared(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config = {"installed": {"client_id": "id"}}
+    encoded = base64.b64encode(json.dumps(config).encode("utf-8")).decode("utf-8")
+    monkeypatch.setenv(oauth_module.CLIENT_SECRET_B64_ENV, encoded)
+
+    first = oauth_module._load_client_config()
+    monkeypatch.setenv(oauth_module.CLIENT_SECRET_B64_ENV, "not base64 json")
+
+    assert oauth_module._load_client_config() is first
+
+    oauth_module.clear_cache()
+    with pytest.raises(ValueError):
+        oauth_module._load_client_config()
+
+
+def test_update_env_variables_rewrites_file_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "# gmail secrets\nGOOGLE_TOKEN_JSON_B64=old\nOTHER=keep\n", encoding="utf-8"
+    )
+    env_path.chmod(0o600)
+    monkeypatch.setattr(oauth_module, "ENV_PATH", env_path)
+    monkeypatch.setenv("GOOGLE_REFRESH_TOKEN", "unchanged")
+
+    oauth_module._update_env_variables(
+        {"GOOGLE_TOKEN_JSON_B64": "new", "GOOGLE_REFRESH_TOKEN": "refresh"}
+    )
+
+    assert env_path.read_text(encoding="utf-8") == (
+        "# gmail secrets\n"
+        "GOOGLE_TOKEN_JSON_B64=new\n"
+        "OTHER=keep\n"
+        "GOOGLE_REFRESH_TOKEN=refresh\n"
+    )
+    assert list(tmp_path.iterdir()) == [env_path]
+    assert stat.S_IMODE(env_path.stat().st_mode) == 0o600
+    assert os.environ["GOOGLE_REFRESH_TOKEN"] == "unchanged"
+
+
 class _StubCredentials:
     def __init__(self, *, expired: bool, refresh_token: str, valid: bool) -> None:
         self.expired = expired
@@ -132,3 +271,17 @@ def _set_required_dependencies(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         oauth_module, "InstalledAppFlow", _DummyInstalledFlow, raising=False
     )
+
+
+def _isolate_token_environment(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Point .env at tmp_path and blank the token variables for this test."""
+    monkeypatch.setattr(oauth_module, "ENV_PATH", tmp_path / ".env")
+    for name in (
+        oauth_module.TOKEN_B64_ENV,
+        oauth_module.REFRESH_TOKEN_ENV,
+        oauth_module.CLIENT_ID_ENV,
+        oauth_module.CLIENT_SECRET_ENV,
+    ):
+        # setenv (rather than delenv) guarantees the value written by
+        # _store_credentials is rolled back after the test.
+        monkeypatch.setenv(name, "")